@@ -0,0 +1,481 @@
+"""
+Minecraft File Verifier and Downloader
+"""
+
+import os
+import json
+import hashlib
+import asyncio
+import aiohttp
+import sqlite3
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+import argparse
+import functools
+
+try:
+    import orjson  # Optional; several times faster on the multi-MB asset indexes
+except ImportError:
+    orjson = None
+
+VERSIONS_JSON = "https://launchermeta.mojang.com/mc/game/version_manifest.json"
+
+ASSET_DOWNLOAD = "https://resources.download.minecraft.net/"
+
+OS_BITS = {'osx': 1, 'linux': 2, 'windows': 4}
+
+ALL_OS = 7  # Every bit in OS_BITS
+
+CHUNK_SIZE = 1 << 20  # 1 MiB, matches aiohttp's internal read buffer
+
+HASH_CACHE_FILE = '.verifyresources-cache.sqlite'
+
+HASH_BATCH_SIZE = 16  # Files per worker call; most assets are tiny, so amortize the IPC round trip
+
+MAX_CONCURRENT_DOWNLOADS = 32
+
+async def fetch_json(session, url, filename):
+    loop = asyncio.get_running_loop()
+    if os.path.exists(filename):
+        return await loop.run_in_executor(None, load_json, filename)
+    else:
+        for attempt in range(3):
+            try:
+                async with session.get(url, timeout=aiohttp.ClientTimeout(total=30)) as response:
+                    text = await response.text()
+                await loop.run_in_executor(None, _write_text, filename, text)
+                return parse_json(text)
+            except Exception as e:
+                if attempt < 2:
+                    await asyncio.sleep(2 ** attempt)  # Exponential backoff
+                else:
+                    raise e
+
+def _write_text(filename, text):
+    dirname = os.path.dirname(filename)
+    if dirname:
+        os.makedirs(dirname, exist_ok=True)
+    with open(filename, "w") as f:
+        f.write(text)
+
+def parse_json(data):
+    return orjson.loads(data) if orjson else json.loads(data)
+
+def load_json(path):
+    with open(path, 'rb') as f:
+        return parse_json(f.read())
+
+# Parsed files are cached keyed on mtime_ns, so re-running in the same
+# session (e.g. pressing Start again in the TUI) skips unchanged files
+
+@functools.lru_cache(maxsize=None)
+def _load_version(json_file, mtime_ns):
+    return load_json(json_file)
+
+def load_version(json_file):
+    return _load_version(json_file, os.stat(json_file).st_mtime_ns)
+
+async def load_versions_async(paths):
+    # Parse in worker threads; failures are returned in place rather than raised
+    loop = asyncio.get_running_loop()
+    return await asyncio.gather(*[loop.run_in_executor(None, load_version, p) for p in paths],
+                                return_exceptions=True)
+
+def find_installed_versions(versions_dir):
+    """Return (version, json_file, jar_file) for each version directory with a version JSON."""
+    installed_versions = []
+    # DirEntry.is_dir() is answered from the directory read on most filesystems, saving a stat per entry
+    with os.scandir(versions_dir) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                json_file = os.path.join(entry.path, f"{entry.name}.json")
+                jar_file = os.path.join(entry.path, f"{entry.name}.jar")
+                if os.path.isfile(json_file):
+                    installed_versions.append((entry.name, json_file, jar_file))
+    return installed_versions
+
+def parse_rules(rules):
+    """Return the OS_BITS mask of operating systems the rules allow."""
+    if not rules:
+        return ALL_OS
+
+    allowed_os = 0
+
+    for rule in rules:
+        action = rule['action']
+        change = 0
+        if 'os' in rule:
+            if not (action == 'disallow' and 'version' in rule['os']):
+                change = OS_BITS.get(rule['os']['name'], 0)
+        else:
+            change = ALL_OS
+
+        if action == 'allow':
+            allowed_os |= change
+        else:
+            allowed_os &= ~change
+    return allowed_os
+
+def get_libraries(libs):
+    libraries = []
+    for lib in libs:
+        allowed_os = parse_rules(lib.get('rules', []))
+        if 'downloads' in lib:
+            if 'artifact' in lib['downloads']:
+                libraries.append(lib['downloads']['artifact'])
+            if 'classifiers' in lib['downloads']:
+                for classifier, info in lib['downloads']['classifiers'].items():
+                    if classifier.startswith('natives-'):
+                        os_name = classifier[8:]
+                        if OS_BITS.get(os_name, 0) & allowed_os:
+                            libraries.append(info)
+    return libraries
+
+@functools.lru_cache(maxsize=None)
+def _version_tasks(json_file, mtime_ns, jar_file, minecraft_dir):
+    version_json = _load_version(json_file, mtime_ns)
+    tasks = []
+
+    # Check client jar
+    if 'downloads' in version_json and 'client' in version_json['downloads']:
+        client_info = version_json['downloads']['client']
+        tasks.append((client_info['url'], jar_file, client_info.get('sha1'), client_info.get('size')))
+
+    # Get libraries
+    libs = get_libraries(version_json.get('libraries', []))
+    for lib in libs:
+        url = lib.get('url')
+        # `path` in the artifact/classifier info provides the relative library path
+        rel = lib.get('path')
+        if rel:
+            local_path = os.path.join(minecraft_dir, 'libraries', *rel.split('/'))
+        else:
+            # Fallback: compute from libraries.minecraft.net URL
+            local_path = url.replace('https://libraries.minecraft.net/', '')
+            local_path = os.path.join(minecraft_dir, 'libraries', local_path)
+        tasks.append((url, local_path, lib.get('sha1'), lib.get('size')))
+    return tuple(tasks)
+
+def version_tasks(json_file, jar_file, minecraft_dir):
+    """Return (url, path, sha, size) tasks for a version's client jar and libraries."""
+    return _version_tasks(json_file, os.stat(json_file).st_mtime_ns, jar_file, minecraft_dir)
+
+async def get_assets(session, asset_index_url, asset_id, cache_dir):
+    index_file = os.path.join(cache_dir, 'assets', f"{asset_id}.json")
+    loop = asyncio.get_running_loop()
+    if not os.path.exists(index_file):
+        # Freshly fetched; expand the index fetch_json already parsed rather than re-reading it
+        index = await fetch_json(session, asset_index_url, index_file)
+        return await loop.run_in_executor(None, _build_assets, index, cache_dir)
+    return await loop.run_in_executor(None, _index_assets, index_file, os.stat(index_file).st_mtime_ns, cache_dir)
+
+# Expanded indexes hold tens of thousands of entries each; keep only a few so
+# stale (older mtime) entries are evicted rather than held for the whole session
+@functools.lru_cache(maxsize=8)
+def _index_assets(index_file, mtime_ns, cache_dir):
+    return _build_assets(load_json(index_file), cache_dir)
+
+def _build_assets(index, cache_dir):
+    if not index:
+        return []
+    # Hoist the path prefix out of the loop; indexes can hold tens of thousands of objects
+    prefix = os.path.join(cache_dir, 'assets', 'objects') + os.sep
+    sep = os.sep
+    # The asset index's `hash` is the sha1 for the object, so include it
+    return [{'url': f"{ASSET_DOWNLOAD}{h[:2]}/{h}", 'path': f"{prefix}{h[:2]}{sep}{h}", 'sha1': h, 'size': obj.get('size')}
+            for obj in index.get('objects', {}).values()
+            for h in (obj['hash'],)]
+
+def compute_sha1(file_path):
+    with open(file_path, 'rb') as f:
+        if hasattr(hashlib, 'file_digest'):
+            # Python 3.11+: read/update loop runs in C against OpenSSL's SHA-1
+            return hashlib.file_digest(f, 'sha1').hexdigest()
+        sha1 = hashlib.sha1()
+        buf = bytearray(CHUNK_SIZE)
+        view = memoryview(buf)
+        while n := f.readinto(buf):
+            sha1.update(view[:n])
+        return sha1.hexdigest()
+
+class HashCache:
+    """Persistent {path: (size, mtime_ns, sha1)} store so unchanged files are not re-hashed."""
+
+    def __init__(self, db_path):
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.execute('CREATE TABLE IF NOT EXISTS hashes '
+                          '(path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, sha1 TEXT)')
+        self.entries = {path: (size, mtime_ns, sha1)
+                        for path, size, mtime_ns, sha1 in self.conn.execute('SELECT * FROM hashes')}
+        self.pending = []
+
+    def lookup(self, path, st):
+        # Only trust the cached digest if the file is unchanged since it was hashed
+        entry = self.entries.get(path)
+        if entry and entry[0] == st.st_size and entry[1] == st.st_mtime_ns:
+            return entry[2]
+        return None
+
+    def store(self, path, size, mtime_ns, sha1):
+        self.entries[path] = (size, mtime_ns, sha1)
+        self.pending.append((path, size, mtime_ns, sha1))
+
+    def commit(self):
+        with self.conn:
+            self.conn.executemany('INSERT OR REPLACE INTO hashes VALUES (?, ?, ?, ?)', self.pending)
+        self.pending.clear()
+
+    def close(self):
+        self.conn.close()
+
+def create_session():
+    # One pooled, keep-alive session so thousands of small asset fetches reuse TLS connections
+    connector = aiohttp.TCPConnector(limit=64, limit_per_host=MAX_CONCURRENT_DOWNLOADS, ttl_dns_cache=300,
+                                     keepalive_timeout=75, enable_cleanup_closed=True)
+    timeout = aiohttp.ClientTimeout(total=None, sock_read=30, sock_connect=10)
+    return aiohttp.ClientSession(connector=connector, headers={'Connection': 'keep-alive'}, timeout=timeout,
+                                 raise_for_status=True)
+
+def _hash_files(paths):
+    # Runs in a worker process; stat first so the cache entry never outlives the hashed content
+    results = []
+    for path in paths:
+        st = os.stat(path)
+        results.append((path, st.st_size, st.st_mtime_ns, compute_sha1(path)))
+    return results
+
+async def find_missing(tasks, cache=None, on_progress=None):
+    """Return (url, path, sha, size, reason) for each task that is missing or corrupt.
+
+    Files whose size differs from the expected one are corrupt without hashing.
+    Files whose size and mtime match the cache are trusted as-is; the rest are
+    hashed in batches in a process pool and on_progress(checked, total) is
+    called as each batch completes.
+    """
+    to_download = []
+    candidates = {}
+    for url, path, sha, size in tasks:
+        try:
+            st = os.stat(path)
+        except OSError:
+            to_download.append((url, path, sha, size, 'missing'))
+            continue
+        if size is not None and st.st_size != size:
+            to_download.append((url, path, sha, size, 'corrupt'))
+            continue
+        if not sha:
+            continue
+        cached = cache.lookup(path, st) if cache else None
+        if cached is None:
+            candidates[path] = (url, path, sha, size)
+        elif cached != sha:
+            to_download.append((url, path, sha, size, 'corrupt'))
+    if not candidates:
+        return to_download
+
+    loop = asyncio.get_running_loop()
+    # Default worker count is the CPU count, capped at 61 on Windows where larger values raise.
+    # Spawn rather than fork: the parent is already running Textual and executor threads.
+    pool = ProcessPoolExecutor(mp_context=multiprocessing.get_context('spawn'))
+    paths = list(candidates)
+    futures = [loop.run_in_executor(pool, _hash_files, paths[i:i + HASH_BATCH_SIZE])
+               for i in range(0, len(paths), HASH_BATCH_SIZE)]
+    try:
+        checked = 0
+        for future in asyncio.as_completed(futures):
+            for path, size, mtime_ns, digest in await future:
+                url, _, sha, expected_size = candidates[path]
+                if digest != sha:
+                    to_download.append((url, path, sha, expected_size, 'corrupt'))
+                if cache:
+                    cache.store(path, size, mtime_ns, digest)
+                checked += 1
+            if on_progress:
+                on_progress(checked, len(candidates))
+    finally:
+        # On cancellation, drop the queued batches instead of blocking the loop until they finish
+        for future in futures:
+            future.cancel()
+        pool.shutdown(wait=False)
+    if cache:
+        cache.commit()
+    return to_download
+
+def _make_dirs(dirs):
+    for d in dirs:
+        os.makedirs(d, exist_ok=True)
+
+async def create_parent_dirs(paths):
+    # Create every destination directory once up front rather than per download
+    dirs = {os.path.dirname(p) for p in paths} - {''}
+    await asyncio.get_running_loop().run_in_executor(None, _make_dirs, dirs)
+
+async def download_file_async(session, url, path, expected_sha=None, check_existing=True):
+    """Download url to path unless a valid copy exists.
+
+    Pass check_existing=False for files already known to be missing or corrupt
+    (e.g. from find_missing) to skip re-hashing them. Returns (downloaded, digest)
+    where digest is the sha1 of the streamed bytes, or None if nothing was downloaded.
+    """
+    if check_existing and os.path.exists(path):
+        if expected_sha:
+            loop = asyncio.get_running_loop()
+            if await loop.run_in_executor(None, compute_sha1, path) == expected_sha:
+                return False, None  # Already have
+        else:
+            return False, None  # Already have
+    async with session.get(url) as response:
+        # Hash while streaming so the file never has to be re-read to verify it
+        sha1 = hashlib.sha1()
+        # A CHUNK_SIZE write buffer coalesces the many small network reads into
+        # a single write() for nearly every asset
+        with open(path, 'wb', buffering=CHUNK_SIZE) as f:
+            size = response.content_length
+            preallocated = False
+            if size and size > CHUNK_SIZE and hasattr(os, 'posix_fallocate'):
+                # Reserve space for large files (client jars) up front instead of growing them per write;
+                # best effort, as not every filesystem supports it
+                try:
+                    os.posix_fallocate(f.fileno(), 0, size)
+                    preallocated = True
+                except OSError:
+                    pass
+            async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+                sha1.update(chunk)
+                f.write(chunk)
+            if preallocated:
+                # Content-Length can differ from the decoded body; drop any preallocated tail
+                f.truncate()
+    return True, sha1.hexdigest()  # Downloaded
+
+
+async def download_file_async_with_retry(session, url, path, expected_sha=None, retries=3, backoff=2,
+                                         check_existing=True):
+    attempt = 0
+    last_exc = None
+    while attempt < retries:
+        try:
+            downloaded, digest = await download_file_async(session, url, path, expected_sha, check_existing)
+            # If no download occurred, file exists and was valid; otherwise check
+            # the digest computed while streaming rather than re-reading the file
+            if downloaded and expected_sha and digest != expected_sha:
+                raise ValueError(f"SHA1 mismatch for {path} after download: expected {expected_sha}, got {digest}")
+            return downloaded
+        except Exception as e:
+            last_exc = e
+            attempt += 1
+            if attempt < retries:
+                await asyncio.sleep(backoff ** attempt)
+            else:
+                raise
+
+async def run_downloads(session, tasks, handler, workers=MAX_CONCURRENT_DOWNLOADS):
+    """Feed (url, path, sha) tasks through a bounded queue to a fixed pool of workers.
+
+    handler(session, url, path, sha) is awaited for each task and is expected to
+    handle its own errors.
+    """
+    queue = asyncio.Queue(maxsize=workers * 2)
+
+    async def producer():
+        for task in tasks:
+            await queue.put(task)
+        for _ in range(workers):
+            await queue.put(None)  # One stop marker per worker
+
+    async def worker():
+        while (task := await queue.get()) is not None:
+            await handler(session, *task)
+
+    await asyncio.gather(producer(), *[worker() for _ in range(workers)])
+
+async def headless(args):
+    # Find Minecraft directory
+    appdata = os.environ.get('APPDATA')
+    if not appdata:
+        print('APPDATA not found')
+        return
+    minecraft_dir = os.path.join(appdata, '.minecraft')
+    if not os.path.exists(minecraft_dir):
+        print(f'Minecraft directory not found: {minecraft_dir}')
+        return
+    versions_dir = os.path.join(minecraft_dir, 'versions')
+    if not os.path.exists(versions_dir):
+        print(f'Versions directory not found: {versions_dir}')
+        return
+
+    # Build list of installed versions
+    loop = asyncio.get_running_loop()
+    installed_versions = await loop.run_in_executor(None, find_installed_versions, versions_dir)
+
+    print(f'Found {len(installed_versions)} installed versions')
+    # Collect tasks
+    async with create_session() as session:
+        tasks = []
+        asset_ids = set()
+        version_jsons = await load_versions_async(json_file for _, json_file, _ in installed_versions)
+        for (version, json_file, jar_file), version_json in zip(installed_versions, version_jsons):
+            print(f'Processing {version}')
+            if isinstance(version_json, Exception):
+                print(f'Error loading {json_file}: {version_json}')
+                continue
+            tasks.extend(version_tasks(json_file, jar_file, minecraft_dir))
+            if 'assetIndex' in version_json and version_json['assetIndex']['id'] not in asset_ids:
+                asset_info = version_json['assetIndex']
+                asset_ids.add(asset_info['id'])
+                assets = await get_assets(session, asset_info['url'], asset_info['id'], minecraft_dir)
+                for a in assets:
+                    # Use asset index hash as expected SHA1
+                    tasks.append((a['url'], a['path'], a.get('sha1'), a.get('size')))
+
+        # Versions share libraries and assets; check and fetch each path only once
+        tasks = list({task[1]: task for task in tasks}.values())
+
+        # Filter tasks to missing or mismatched sha
+        cache = HashCache(os.path.join(minecraft_dir, HASH_CACHE_FILE))
+        try:
+            to_download = await find_missing(tasks, cache)
+        finally:
+            cache.close()
+
+        if not to_download:
+            print('All files are up to date and valid')
+            return
+
+        print(f'Files to fetch: {len(to_download)}')
+        for url, path, sha, _, reason in to_download:
+            print(f'  - {reason}: {path} (sha: {sha})')
+
+        if args.dry_run:
+            print('Dry run; not downloading any files')
+            return
+
+        await create_parent_dirs(path for _, path, _, _, _ in to_download)
+        async def dl(session, url, path, sha):
+            try:
+                # find_missing already classified this file, so don't hash it again
+                ok = await download_file_async_with_retry(session, url, path, sha, check_existing=False)
+                print(f'Downloaded: {path}') if ok else print(f'OK: {path}')
+            except Exception as e:
+                print(f'Error downloading {url} -> {path}: {e}')
+
+        await run_downloads(session, ((url, path, sha) for url, path, sha, _, _ in to_download), dl)
+
+def main():
+    parser = argparse.ArgumentParser(description='Minecraft resource verifier and downloader')
+    parser.add_argument('--nogui', action='store_true', help='Run in headless CLI mode')
+    parser.add_argument('--dry-run', action='store_true', help='List missing/corrupt files without downloading')
+    args = parser.parse_args()
+    if args.nogui:
+        # Run CLI headless mode
+        asyncio.run(headless(args))
+    else:
+        # Textual is only imported when the TUI is actually used
+        from locate_resources_tui import MinecraftVerifier
+        app = MinecraftVerifier()
+        app.run()
+
+if __name__ == '__main__':
+    main()
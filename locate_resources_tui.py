@@ -0,0 +1,150 @@
+"""
+Minecraft File Verifier and Downloader TUI
+"""
+
+import os
+from textual.app import App, ComposeResult
+from textual.widgets import SelectionList, Button, ProgressBar, Label, Header, Footer
+from textual.containers import Vertical
+from locate_resources import (HASH_CACHE_FILE, HashCache, create_parent_dirs, create_session,
+                              download_file_async_with_retry, find_installed_versions, find_missing,
+                              get_assets, load_versions_async, run_downloads, version_tasks)
+
+class MinecraftVerifier(App):
+    CSS = """
+    Screen {
+        layout: vertical;
+    }
+    Vertical {
+        height: 100%;
+    }
+    SelectionList {
+        height: 50%;
+        border: solid white;
+    }
+    ProgressBar {
+        margin: 1;
+    }
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.installed_versions = []
+        self.selected_versions = []
+
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Vertical(
+            SelectionList(id="versions"),
+            Button("Start Verification", id="start", disabled=True),
+            ProgressBar(id="progress", total=100),
+            Label("Status: Loading versions...", id="status"),
+        )
+        yield Footer()
+
+    def on_mount(self):
+        self.load_versions()
+
+    def load_versions(self):
+        # Find Minecraft directory
+        appdata = os.environ.get('APPDATA')
+        if not appdata:
+            self.query_one("#status").update("Error: APPDATA not found")
+            return
+        minecraft_dir = os.path.join(appdata, '.minecraft')
+        if not os.path.exists(minecraft_dir):
+            self.query_one("#status").update(f"Error: Minecraft directory not found: {minecraft_dir}")
+            return
+
+        versions_dir = os.path.join(minecraft_dir, 'versions')
+        if not os.path.exists(versions_dir):
+            self.query_one("#status").update(f"Error: Versions directory not found: {versions_dir}")
+            return
+
+        # Get all installed versions
+        self.installed_versions = find_installed_versions(versions_dir)
+
+        selection_list = self.query_one("#versions")
+        selection_list.add_options([(version, version) for version, _, _ in self.installed_versions])
+
+        self.query_one("#status").update(f"Found {len(self.installed_versions)} installed versions. Select versions and click Start.")
+        self.query_one("#start").disabled = False
+
+    def on_button_pressed(self, event: Button.Pressed):
+        if event.button.id == "start":
+            selection_list = self.query_one("#versions")
+            selected = selection_list.selected
+            self.selected_versions = [v for v in self.installed_versions if v[0] in selected]
+            if not self.selected_versions:
+                self.query_one("#status").update("No versions selected.")
+                return
+            self.query_one("#start").disabled = True
+            self.query_one("#status").update("Processing selected versions...")
+            self.run_worker(self.verify_and_download())
+
+    async def verify_and_download(self):
+        minecraft_dir = os.path.join(os.environ['APPDATA'], '.minecraft')
+        async with create_session() as session:
+            tasks = []
+            asset_ids = set()
+            version_jsons = await load_versions_async(json_file for _, json_file, _ in self.selected_versions)
+            for (version, json_file, jar_file), version_json in zip(self.selected_versions, version_jsons):
+                if isinstance(version_json, Exception):
+                    self.query_one("#status").update(f"Error loading {json_file}: {version_json}")
+                    continue
+
+                # Check client jar and libraries
+                tasks.extend(version_tasks(json_file, jar_file, minecraft_dir))
+
+                # Get assets; versions often share an asset index, so only expand each one once
+                if 'assetIndex' in version_json and version_json['assetIndex']['id'] not in asset_ids:
+                    asset_index_url = version_json['assetIndex']['url']
+                    asset_id = version_json['assetIndex']['id']
+                    asset_ids.add(asset_id)
+                    assets = await get_assets(session, asset_index_url, asset_id, minecraft_dir)
+                    for asset in assets:
+                        tasks.append((asset['url'], asset['path'], asset['sha1'], asset['size']))
+
+            # Versions share libraries and assets; check and fetch each path only once
+            tasks = list({task[1]: task for task in tasks}.values())
+
+            # Filter tasks to only missing ones
+            progress = self.query_one("#progress")
+            self.query_one("#status").update(f"Verifying {len(tasks)} files...")
+            cache = HashCache(os.path.join(minecraft_dir, HASH_CACHE_FILE))
+            try:
+                missing_tasks = [
+                    (url, path, sha)
+                    for url, path, sha, _, _ in await find_missing(
+                        tasks, cache, lambda checked, total: progress.update(total=total, progress=checked))
+                ]
+            finally:
+                cache.close()
+
+            if not missing_tasks:
+                self.query_one("#status").update("All files are up to date!")
+                self.query_one("#start").disabled = False
+                return
+
+            progress.update(total=len(missing_tasks), progress=0)
+            self.query_one("#status").update(f"Downloading {len(missing_tasks)} files...")
+
+            async def reliable_download(session, url, path, sha, retries=3):
+                # Use the download_file_async_with_retry wrapper which already has backoff and sha verification;
+                # find_missing already classified these files, so skip re-hashing the existing copy
+                return await download_file_async_with_retry(session, url, path, sha, retries, check_existing=False)
+
+            async def download_with_progress(session, url, path, sha):
+                try:
+                    downloaded = await reliable_download(session, url, path, sha)
+                    if downloaded:
+                        self.query_one("#progress").advance(1)
+                except Exception as e:
+                    # Update status with a brief message but continue with other downloads
+                    self.query_one("#status").update(f"Error downloading {url}: {e}")
+
+            await create_parent_dirs(path for _, path, _ in missing_tasks)
+            await run_downloads(session, missing_tasks, download_with_progress)
+
+            self.query_one("#status").update("Verification and download complete!")
+            self.query_one("#start").disabled = False